@@ -1,14 +1,11 @@
 """CLI entry point for edesto-dev."""
 
-import glob as globmod
-import shutil
-import subprocess
-from pathlib import Path
+import os
 
 import click
 
-from edesto_dev.boards import get_board, list_boards, detect_boards, BoardNotFoundError
-from edesto_dev.templates import render_template
+# Modules only needed by a single command are imported inside that command,
+# so e.g. `edesto doctor` never loads the board table or the templates.
 
 
 @click.group()
@@ -22,6 +19,10 @@ def main():
 @click.option("--port", type=str, help="Serial port (e.g. /dev/ttyUSB0, /dev/cu.usbserial-0001).")
 def init(board, port):
     """Generate a CLAUDE.md for your board."""
+    from pathlib import Path
+
+    from edesto_dev.boards import get_board, detect_boards, BoardNotFoundError
+
     if board and port:
         # Both provided — skip detection
         try:
@@ -74,6 +75,8 @@ def init(board, port):
             click.echo("Error: --board is required when using --port. Use 'edesto boards' to list supported boards.")
             raise SystemExit(1)
 
+    from edesto_dev.templates import render_template
+
     content = render_template(board_def, port=port)
 
     claude_path = Path("CLAUDE.md")
@@ -84,8 +87,11 @@ def init(board, port):
             click.echo("Aborted.")
             return
 
-    claude_path.write_text(content)
-    cursor_path.write_text(content)
+    # Write the same encoded payload to both files. Copying CLAUDE.md would fail
+    # when .cursorrules is already a link to it.
+    payload = content.encode("utf-8")
+    claude_path.write_bytes(payload)
+    cursor_path.write_bytes(payload)
 
     click.echo(f"Generated CLAUDE.md for {board_def.name} on {port}")
     click.echo("Also created .cursorrules for Cursor users.")
@@ -94,17 +100,24 @@ def init(board, port):
 @main.command()
 def boards():
     """List supported boards."""
+    from edesto_dev.boards import list_boards
+
     board_list = list_boards()
-    click.echo(f"Supported boards ({len(board_list)}):\n")
-    click.echo(f"  {'Slug':<20} {'Name':<30} {'FQBN'}")
-    click.echo(f"  {'─' * 20} {'─' * 30} {'─' * 40}")
-    for b in board_list:
-        click.echo(f"  {b.slug:<20} {b.name:<30} {b.fqbn}")
+    lines = [
+        f"Supported boards ({len(board_list)}):\n",
+        f"  {'Slug':<20} {'Name':<30} {'FQBN'}",
+        f"  {'─' * 20} {'─' * 30} {'─' * 40}",
+    ]
+    lines.extend(f"  {b.slug:<20} {b.name:<30} {b.fqbn}" for b in board_list)
+    click.echo("\n".join(lines))
 
 
 @main.command()
 def doctor():
     """Check your environment for embedded development."""
+    import shutil
+    import subprocess
+
     ok = True
 
     # Check arduino-cli
@@ -112,11 +125,13 @@ def doctor():
     if arduino_cli:
         click.echo(f"[OK] arduino-cli found: {arduino_cli}")
         try:
-            version = subprocess.run(
+            # Only stdout's first line is shown, so stderr is discarded rather than captured.
+            result = subprocess.run(
                 ["arduino-cli", "version"],
-                capture_output=True, text=True, timeout=5
+                stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True, timeout=5,
             )
-            click.echo(f"     {version.stdout.strip()}")
+            version = result.stdout.strip().partition("\n")[0]
+            click.echo(f"     {version}")
         except (subprocess.TimeoutExpired, FileNotFoundError):
             pass
     else:
@@ -124,7 +139,7 @@ def doctor():
         ok = False
 
     # Check serial ports
-    ports = globmod.glob("/dev/ttyUSB*") + globmod.glob("/dev/ttyACM*") + globmod.glob("/dev/cu.usb*")
+    ports = _serial_ports()
     if ports:
         click.echo("[OK] Serial ports found:")
         for p in ports:
@@ -145,3 +160,17 @@ def doctor():
         click.echo("\nAll checks passed. Ready for embedded development.")
     else:
         click.echo("\nSome checks failed. Fix the issues above before running 'edesto init'.")
+
+
+_SERIAL_PORT_PREFIXES = ("ttyUSB", "ttyACM", "cu.usb")
+
+
+def _serial_ports() -> list[str]:
+    """List likely USB serial devices with a single pass over /dev."""
+    try:
+        with os.scandir("/dev") as entries:
+            ports = [f"/dev/{e.name}" for e in entries if e.name.startswith(_SERIAL_PORT_PREFIXES)]
+    except OSError:
+        return []
+    ports.sort()
+    return ports
@@ -1,66 +1,45 @@
 """CLAUDE.md template rendering for edesto-dev."""
 
-from edesto_dev.boards import Board
+from functools import lru_cache
 
-
-def render_template(board: Board, port: str) -> str:
-    """Render a complete CLAUDE.md for the given board and port."""
-    sections = [
-        _header(board, port),
-        _commands(board, port),
-        _dev_loop(board, port),
-        _validation(board, port),
-        _datasheets(),
-        _board_info(board),
-    ]
-    return "\n".join(sections)
+from edesto_dev.boards import _BUILT_BOARDS, Board
 
 
-def _header(board: Board, port: str) -> str:
-    return f"""# Embedded Development: {board.name}
+_TEMPLATE = """# Embedded Development: {name}
 
-You are developing firmware for a {board.name} connected via USB.
+You are developing firmware for a {name} connected via USB.
 
 ## Hardware
-- Board: {board.name}
-- FQBN: {board.fqbn}
+- Board: {name}
+- FQBN: {fqbn}
 - Port: {port}
 - Framework: Arduino
-- Baud rate: {board.baud_rate}"""
+- Baud rate: {baud}
 
-
-def _commands(board: Board, port: str) -> str:
-    return f"""
 ## Commands
 
 Compile:
 ```
-arduino-cli compile --fqbn {board.fqbn} .
+arduino-cli compile --fqbn {fqbn} .
 ```
 
 Flash:
 ```
-arduino-cli upload --fqbn {board.fqbn} --port {port} .
-```"""
-
+arduino-cli upload --fqbn {fqbn} --port {port} .
+```
 
-def _dev_loop(board: Board, port: str) -> str:
-    return f"""
 ## Development Loop
 
 Every time you change code, follow this exact sequence:
 
 1. Edit the .ino file (or .cpp/.h files)
-2. Compile: `arduino-cli compile --fqbn {board.fqbn} .`
+2. Compile: `arduino-cli compile --fqbn {fqbn} .`
 3. If compile fails, read the errors, fix them, and recompile. Do NOT flash broken code.
-4. Flash: `arduino-cli upload --fqbn {board.fqbn} --port {port} .`
+4. Flash: `arduino-cli upload --fqbn {fqbn} --port {port} .`
 5. Wait 3 seconds for the board to reboot.
 6. **Validate your changes** using the method below.
-7. If validation fails, go back to step 1 and iterate."""
-
+7. If validation fails, go back to step 1 and iterate.
 
-def _validation(board: Board, port: str) -> str:
-    return f"""
 ## Validation
 
 This is how you verify your code is actually working on the device. Always validate after flashing.
@@ -71,11 +50,13 @@ Use this Python snippet to capture serial output from the board:
 
 ```python
 import serial, time
-ser = serial.Serial('{port}', {board.baud_rate}, timeout=1)
+ser = serial.Serial('{port}', {baud}, timeout=1)  # readline() needs time for a whole line to arrive
+if hasattr(ser, 'set_buffer_size'):  # Windows only
+    ser.set_buffer_size(rx_size=65536)
 time.sleep(3)  # Wait for boot
 lines = []
-start = time.time()
-while time.time() - start < 10:  # Read for 10 seconds
+deadline = time.monotonic() + 10  # Read for 10 seconds
+while time.monotonic() < deadline:
     line = ser.readline().decode('utf-8', errors='ignore').strip()
     if line:
         lines.append(line)
@@ -86,15 +67,12 @@ ser.close()
 Save this as `read_serial.py` and run with `python read_serial.py`. Parse the output to check if your firmware is behaving correctly.
 
 **Important serial conventions for your firmware:**
-- Always use `Serial.begin({board.baud_rate})` in setup()
+- Always use `Serial.begin({baud})` in setup()
 - Use `Serial.println()` (not `Serial.print()`) so each message is a complete line
 - Print `[READY]` when initialization is complete
 - Print `[ERROR] <description>` for any error conditions
-- Use tags for structured output: `[SENSOR] temp=23.4`, `[STATUS] running`"""
-
+- Use tags for structured output: `[SENSOR] temp=23.4`, `[STATUS] running`
 
-def _datasheets() -> str:
-    return """
 ## Datasheets
 
 Before writing or debugging firmware, check for datasheets in this project:
@@ -106,28 +84,28 @@ When you find a datasheet:
 - Read it to understand the hardware you're interfacing with.
 - Use the correct register addresses, pin assignments, and protocol settings from the datasheet — not from memory or guesswork.
 - Pay attention to voltage levels, max current ratings, and timing requirements.
-- If a datasheet contradicts the pin reference below, the datasheet is correct."""
+- If a datasheet contradicts the pin reference below, the datasheet is correct.
+{board_info}"""
 
 
-def _board_info(board: Board) -> str:
-    parts = [f"\n## {board.name}-Specific Information"]
+def render_template(board: Board, port: str) -> str:
+    """Render a complete CLAUDE.md for the given board and port."""
+    # Registered boards are immutable, so their output can be memoized by slug.
+    if _BUILT_BOARDS.get(board.slug) is board:
+        return _render_cached(board.slug, port)
+    return _render(board, port)
 
-    # Capabilities with includes
-    if board.includes:
-        parts.append("\n### Capabilities")
-        for cap, include in board.includes.items():
-            parts.append(f"- {cap.replace('_', ' ').title()}: `{include}`")
 
-    # Pin reference
-    if board.pin_notes:
-        parts.append("\n### Pin Reference")
-        for note in board.pin_notes:
-            parts.append(f"- {note}")
+@lru_cache(maxsize=64)
+def _render_cached(slug: str, port: str) -> str:
+    return _render(_BUILT_BOARDS[slug], port)
 
-    # Pitfalls
-    if board.pitfalls:
-        parts.append("\n### Common Pitfalls")
-        for pitfall in board.pitfalls:
-            parts.append(f"- {pitfall}")
 
-    return "\n".join(parts)
+def _render(board: Board, port: str) -> str:
+    return _TEMPLATE.format(
+        name=board.name,
+        fqbn=board.fqbn,
+        port=port,
+        baud=board.baud_rate,
+        board_info=board.cached_fragment,
+    )
@@ -8,8 +8,8 @@ ser = serial.Serial(PORT, 115200, timeout=1)
 time.sleep(3)
 
 results = []
-start = time.time()
-while time.time() - start < 15 and len(results) < 5:
+deadline = time.monotonic() + 15
+while time.monotonic() < deadline and len(results) < 5:
     line = ser.readline().decode("utf-8", errors="ignore").strip()
     if "[SENSOR]" in line:
         parts = dict(p.split("=") for p in line.split("[SENSOR]")[1].strip().split())
@@ -11,8 +11,8 @@ ser = serial.Serial(PORT, 115200, timeout=1)
 time.sleep(5)
 
 ip = None
-start = time.time()
-while time.time() - start < 15:
+deadline = time.monotonic() + 15
+while time.monotonic() < deadline:
     line = ser.readline().decode("utf-8", errors="ignore").strip()
     if "[WIFI] IP:" in line:
         ip = line.split("IP:")[-1].strip()
@@ -1,11 +1,41 @@
-import serial, time
-ser = serial.Serial('/dev/cu.usbserial-110', 115200, timeout=1)
+import serial, sys, time
+ser = serial.Serial('/dev/cu.usbserial-110', 115200, timeout=0.05)
+if hasattr(ser, 'set_buffer_size'):  # Windows only
+    ser.set_buffer_size(rx_size=65536)
 time.sleep(3)  # Wait for boot
 lines = []
-start = time.time()
-while time.time() - start < 10:  # Read for 10 seconds
-    line = ser.readline().decode('utf-8', errors='ignore').strip()
-    if line:
-        lines.append(line)
-        print(line)
+pending = []
+# Coalesce output writes; batch more aggressively when stdout is redirected
+batch_size = 32 if sys.stdout.isatty() else 1024
+last_flush = time.monotonic()
+
+def flush():
+    global last_flush
+    if pending:
+        sys.stdout.write("\n".join(pending) + "\n")
+        sys.stdout.flush()
+        pending.clear()
+    last_flush = time.monotonic()
+
+buf = bytearray()
+deadline = time.monotonic() + 10  # Read for 10 seconds
+while time.monotonic() < deadline:
+    chunk = ser.read(max(1, ser.in_waiting))  # Waits at most the 50 ms read timeout
+    if chunk:
+        buf.extend(chunk)
+        # Split whatever arrived into complete lines; keep any partial line for the next read
+        while (nl := buf.find(b'\n')) != -1:
+            line = bytes(buf[:nl]).decode('utf-8', errors='ignore').strip()
+            del buf[:nl + 1]
+            if line:
+                lines.append(line)
+                pending.append(line)
+    if len(pending) >= batch_size or time.monotonic() - last_flush > 0.1:
+        flush()
+# Keep a final message that arrived without a trailing newline
+line = bytes(buf).decode('utf-8', errors='ignore').strip()
+if line:
+    lines.append(line)
+    pending.append(line)
+flush()
 ser.close()
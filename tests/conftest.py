@@ -0,0 +1,19 @@
+"""Shared fixtures and constants for the edesto-dev test suite."""
+
+import pytest
+
+from edesto_dev.boards import list_boards
+
+ALL_BOARD_SLUGS: tuple[str, ...] = (
+    "esp32", "esp32s3", "esp32c3", "esp32c6",
+    "esp8266",
+    "arduino-uno", "arduino-nano", "arduino-mega",
+    "rp2040",
+    "teensy40", "teensy41",
+    "stm32-nucleo",
+)
+
+
+@pytest.fixture(scope="session")
+def all_boards():
+    return list_boards()
@@ -1,10 +1,14 @@
 """Tests for board definitions."""
 
+import copy
 import json
+import pickle
+from dataclasses import FrozenInstanceError, asdict
 from unittest.mock import patch, MagicMock
 
 import pytest
-from edesto_dev.boards import get_board, get_board_by_fqbn, list_boards, detect_boards, BoardNotFoundError
+from edesto_dev.boards import BOARDS, get_board, get_board_by_fqbn, list_boards, detect_boards, BoardNotFoundError
+from tests.conftest import ALL_BOARD_SLUGS
 
 
 class TestGetBoard:
@@ -39,33 +43,56 @@ class TestGetBoard:
         assert len(board.pitfalls) > 0
         assert any("ADC2" in p for p in board.pitfalls)
 
+    def test_has_pitfall(self):
+        board = get_board("esp32")
+        assert board.has_pitfall("ADC2")
+        assert board.has_pitfall("adc2")
+        assert not board.has_pitfall("ADC")
+        assert not get_board("arduino-uno").has_pitfall("ADC2")
+
+    def test_board_is_immutable(self):
+        board = get_board("esp32")
+        with pytest.raises(FrozenInstanceError):
+            board.baud_rate = 9600
+
+    def test_board_copies_and_converts(self):
+        board = get_board("esp32")
+        assert asdict(board)["pins"] == board.pins
+        assert copy.deepcopy(board) == board
+        assert pickle.loads(pickle.dumps(board)) == board
+
+    def test_board_uses_slots(self):
+        board = get_board("esp32")
+        assert not hasattr(board, "__dict__")
+        assert hash(board) == hash(get_board("esp32"))
+
+    def test_board_built_once(self):
+        assert get_board("esp32") is get_board("esp32")
+
     def test_unknown_board_raises(self):
         with pytest.raises(BoardNotFoundError):
             get_board("nonexistent")
 
 
 class TestListBoards:
-    def test_returns_list(self):
+    def test_returns_tuple(self):
         boards = list_boards()
-        assert isinstance(boards, list)
+        assert isinstance(boards, tuple)
         assert len(boards) > 0
 
+    def test_result_is_reused(self):
+        assert list_boards() is list_boards()
+
+    def test_boards_mapping_holds_every_board(self):
+        assert list(BOARDS) == list(ALL_BOARD_SLUGS)
+        assert BOARDS["esp32"] is get_board("esp32")
+
     def test_esp32_in_list(self):
         boards = list_boards()
         slugs = [b.slug for b in boards]
         assert "esp32" in slugs
 
 
-ALL_BOARD_SLUGS = [
-    "esp32", "esp32s3", "esp32c3", "esp32c6",
-    "esp8266",
-    "arduino-uno", "arduino-nano", "arduino-mega",
-    "rp2040",
-    "teensy40", "teensy41",
-    "stm32-nucleo",
-]
-
-
 class TestAllBoards:
     def test_all_boards_registered(self):
         boards = list_boards()
@@ -282,6 +309,25 @@ class TestDetectBoards:
         detected = detect_boards()
         assert detected == []
 
+    @patch("edesto_dev.boards.subprocess.run")
+    def test_invalid_json_returns_empty(self, mock_run):
+        mock_run.return_value = _mock_subprocess("not json")
+        detected = detect_boards()
+        assert detected == []
+
+    @patch("edesto_dev.boards.subprocess.run")
+    def test_parses_bytes_output(self, mock_run):
+        mock_run.return_value = _mock_subprocess(ARDUINO_CLI_ONE_BOARD.encode())
+        detected = detect_boards()
+        assert len(detected) == 1
+        assert detected[0].board.slug == "esp32"
+
+    @patch("edesto_dev.boards.subprocess.run")
+    def test_invalid_utf8_returns_empty(self, mock_run):
+        mock_run.return_value = _mock_subprocess(b"\xff\xfe not json")
+        detected = detect_boards()
+        assert detected == []
+
     @patch("edesto_dev.boards.subprocess.run")
     def test_vid_pid_fallback_ch340(self, mock_run):
         mock_run.return_value = _mock_subprocess(ARDUINO_CLI_CH340_NO_MATCH)
@@ -1,6 +1,7 @@
 """Tests for the edesto CLI."""
 
 import json
+import subprocess
 from pathlib import Path
 from unittest.mock import patch, MagicMock
 
@@ -9,120 +10,137 @@ from click.testing import CliRunner
 
 from edesto_dev.cli import main
 from edesto_dev.boards import DetectedBoard, get_board
+from tests.conftest import ALL_BOARD_SLUGS
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def runner():
     return CliRunner()
 
 
+@pytest.fixture(scope="class")
+def inited_esp32(runner, tmp_path_factory):
+    """Run `edesto init` for an ESP32 once and share the result and directory."""
+    path = tmp_path_factory.mktemp("init-esp32")
+    with pytest.MonkeyPatch.context() as mp:
+        mp.chdir(path)
+        result = runner.invoke(main, ["init", "--board", "esp32", "--port", "/dev/ttyUSB0"], standalone_mode=False, catch_exceptions=False)
+    return result, path
+
+
 class TestInit:
-    def test_init_with_board_and_port(self, runner):
-        with runner.isolated_filesystem():
-            result = runner.invoke(main, ["init", "--board", "esp32", "--port", "/dev/ttyUSB0"])
-            assert result.exit_code == 0
-            assert Path("CLAUDE.md").exists()
-
-    def test_init_generates_valid_content(self, runner):
-        with runner.isolated_filesystem():
-            result = runner.invoke(main, ["init", "--board", "esp32", "--port", "/dev/ttyUSB0"])
-            content = Path("CLAUDE.md").read_text()
-            assert "esp32:esp32:esp32" in content
-            assert "/dev/ttyUSB0" in content
-            assert "Development Loop" in content
-
-    def test_init_also_creates_cursorrules(self, runner):
-        with runner.isolated_filesystem():
-            result = runner.invoke(main, ["init", "--board", "esp32", "--port", "/dev/ttyUSB0"])
-            assert Path(".cursorrules").exists()
-            claude = Path("CLAUDE.md").read_text()
-            cursor = Path(".cursorrules").read_text()
-            assert claude == cursor
-
-    def test_init_unknown_board_fails(self, runner):
-        with runner.isolated_filesystem():
-            result = runner.invoke(main, ["init", "--board", "nonexistent", "--port", "/dev/ttyUSB0"])
-            assert result.exit_code != 0
-            assert "Unknown board" in result.output
-
-    def test_init_asks_before_overwrite(self, runner):
-        with runner.isolated_filesystem():
-            Path("CLAUDE.md").write_text("existing content")
-            result = runner.invoke(main, ["init", "--board", "esp32", "--port", "/dev/ttyUSB0"], input="n\n")
-            assert result.exit_code == 0
-            assert Path("CLAUDE.md").read_text() == "existing content"
-
-    def test_init_overwrites_when_confirmed(self, runner):
-        with runner.isolated_filesystem():
-            Path("CLAUDE.md").write_text("existing content")
-            result = runner.invoke(main, ["init", "--board", "esp32", "--port", "/dev/ttyUSB0"], input="y\n")
-            assert result.exit_code == 0
-            assert "esp32:esp32:esp32" in Path("CLAUDE.md").read_text()
-
-    def test_init_all_boards_work(self, runner):
-        from edesto_dev.boards import list_boards
-        for board in list_boards():
-            with runner.isolated_filesystem():
-                result = runner.invoke(main, ["init", "--board", board.slug, "--port", "/dev/ttyUSB0"])
-                assert result.exit_code == 0, f"Failed for {board.slug}: {result.output}"
-                assert Path("CLAUDE.md").exists()
+    def test_init_with_board_and_port(self, inited_esp32):
+        result, path = inited_esp32
+        assert result.exit_code == 0
+        assert (path / "CLAUDE.md").exists()
+
+    def test_init_generates_valid_content(self, inited_esp32):
+        _, path = inited_esp32
+        content = (path / "CLAUDE.md").read_text()
+        assert "esp32:esp32:esp32" in content
+        assert "/dev/ttyUSB0" in content
+        assert "Development Loop" in content
+
+    def test_init_also_creates_cursorrules(self, inited_esp32):
+        _, path = inited_esp32
+        assert (path / ".cursorrules").exists()
+        claude = (path / "CLAUDE.md").read_bytes()
+        cursor = (path / ".cursorrules").read_bytes()
+        assert claude == cursor
+
+    def test_init_unknown_board_fails(self, runner, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        result = runner.invoke(main, ["init", "--board", "nonexistent", "--port", "/dev/ttyUSB0"])
+        assert result.exit_code != 0
+        assert "Unknown board" in result.output
+
+    def test_init_asks_before_overwrite(self, runner, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        Path("CLAUDE.md").write_text("existing content")
+        result = runner.invoke(main, ["init", "--board", "esp32", "--port", "/dev/ttyUSB0"], input="n\n")
+        assert result.exit_code == 0
+        assert Path("CLAUDE.md").read_text() == "existing content"
+
+    def test_init_overwrites_when_confirmed(self, runner, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        Path("CLAUDE.md").write_text("existing content")
+        result = runner.invoke(main, ["init", "--board", "esp32", "--port", "/dev/ttyUSB0"], input="y\n", standalone_mode=False, catch_exceptions=False)
+        assert result.exit_code == 0
+        assert "esp32:esp32:esp32" in Path("CLAUDE.md").read_text()
+
+    def test_init_overwrites_when_cursorrules_links_to_claude_md(self, runner, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        Path("CLAUDE.md").write_text("existing content")
+        Path(".cursorrules").symlink_to("CLAUDE.md")
+        result = runner.invoke(main, ["init", "--board", "esp32", "--port", "/dev/ttyUSB0"], input="y\n")
+        assert result.exit_code == 0, result.output
+        assert Path(".cursorrules").is_symlink()
+        assert "esp32:esp32:esp32" in Path("CLAUDE.md").read_text()
+        assert Path(".cursorrules").read_bytes() == Path("CLAUDE.md").read_bytes()
+
+    @pytest.mark.parametrize("slug", ALL_BOARD_SLUGS)
+    def test_init_all_boards_work(self, runner, slug, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        result = runner.invoke(main, ["init", "--board", slug, "--port", "/dev/ttyUSB0"], standalone_mode=False, catch_exceptions=False)
+        assert result.exit_code == 0, f"Failed for {slug}: {result.output}"
+        assert Path("CLAUDE.md").exists()
 
 
 class TestInitAutoDetect:
-    @patch("edesto_dev.cli.detect_boards")
-    def test_auto_detects_single_board(self, mock_detect, runner):
+    @patch("edesto_dev.boards.detect_boards")
+    def test_auto_detects_single_board(self, mock_detect, runner, tmp_path, monkeypatch):
         mock_detect.return_value = [DetectedBoard(board=get_board("esp32"), port="/dev/cu.usbserial-0001")]
-        with runner.isolated_filesystem():
-            result = runner.invoke(main, ["init"])
-            assert result.exit_code == 0
-            assert Path("CLAUDE.md").exists()
-            content = Path("CLAUDE.md").read_text()
-            assert "esp32:esp32:esp32" in content
-            assert "/dev/cu.usbserial-0001" in content
-
-    @patch("edesto_dev.cli.detect_boards")
-    def test_auto_detect_prints_what_it_found(self, mock_detect, runner):
+        monkeypatch.chdir(tmp_path)
+        result = runner.invoke(main, ["init"], standalone_mode=False, catch_exceptions=False)
+        assert result.exit_code == 0
+        assert Path("CLAUDE.md").exists()
+        content = Path("CLAUDE.md").read_text()
+        assert "esp32:esp32:esp32" in content
+        assert "/dev/cu.usbserial-0001" in content
+
+    @patch("edesto_dev.boards.detect_boards")
+    def test_auto_detect_prints_what_it_found(self, mock_detect, runner, tmp_path, monkeypatch):
         mock_detect.return_value = [DetectedBoard(board=get_board("esp32"), port="/dev/cu.usbserial-0001")]
-        with runner.isolated_filesystem():
-            result = runner.invoke(main, ["init"])
-            assert "Detected" in result.output or "detected" in result.output
-            assert "ESP32" in result.output
+        monkeypatch.chdir(tmp_path)
+        result = runner.invoke(main, ["init"])
+        assert "Detected" in result.output or "detected" in result.output
+        assert "ESP32" in result.output
 
-    @patch("edesto_dev.cli.detect_boards")
-    def test_auto_detect_multiple_boards_asks_user(self, mock_detect, runner):
+    @patch("edesto_dev.boards.detect_boards")
+    def test_auto_detect_multiple_boards_asks_user(self, mock_detect, runner, tmp_path, monkeypatch):
         mock_detect.return_value = [
             DetectedBoard(board=get_board("esp32"), port="/dev/cu.usbserial-0001"),
             DetectedBoard(board=get_board("arduino-uno"), port="/dev/ttyACM0"),
         ]
-        with runner.isolated_filesystem():
-            result = runner.invoke(main, ["init"], input="1\n")
-            assert result.exit_code == 0
-            assert Path("CLAUDE.md").exists()
+        monkeypatch.chdir(tmp_path)
+        result = runner.invoke(main, ["init"], input="1\n", standalone_mode=False, catch_exceptions=False)
+        assert result.exit_code == 0
+        assert Path("CLAUDE.md").exists()
 
-    @patch("edesto_dev.cli.detect_boards")
-    def test_auto_detect_no_boards_shows_error(self, mock_detect, runner):
+    @patch("edesto_dev.boards.detect_boards")
+    def test_auto_detect_no_boards_shows_error(self, mock_detect, runner, tmp_path, monkeypatch):
         mock_detect.return_value = []
-        with runner.isolated_filesystem():
-            result = runner.invoke(main, ["init"])
-            assert result.exit_code != 0
-            assert "No boards detected" in result.output or "no boards" in result.output.lower()
+        monkeypatch.chdir(tmp_path)
+        result = runner.invoke(main, ["init"])
+        assert result.exit_code != 0
+        assert "No boards detected" in result.output or "no boards" in result.output.lower()
 
-    @patch("edesto_dev.cli.detect_boards")
-    def test_board_flag_skips_detection(self, mock_detect, runner):
+    @patch("edesto_dev.boards.detect_boards")
+    def test_board_flag_skips_detection(self, mock_detect, runner, tmp_path, monkeypatch):
         """When --board and --port are provided, don't call detect_boards."""
-        with runner.isolated_filesystem():
-            result = runner.invoke(main, ["init", "--board", "esp32", "--port", "/dev/ttyUSB0"])
-            assert result.exit_code == 0
-            mock_detect.assert_not_called()
+        monkeypatch.chdir(tmp_path)
+        result = runner.invoke(main, ["init", "--board", "esp32", "--port", "/dev/ttyUSB0"], standalone_mode=False, catch_exceptions=False)
+        assert result.exit_code == 0
+        mock_detect.assert_not_called()
 
-    @patch("edesto_dev.cli.detect_boards")
-    def test_board_flag_without_port_detects_port(self, mock_detect, runner):
+    @patch("edesto_dev.boards.detect_boards")
+    def test_board_flag_without_port_detects_port(self, mock_detect, runner, tmp_path, monkeypatch):
         mock_detect.return_value = [DetectedBoard(board=get_board("esp32"), port="/dev/cu.usbserial-0001")]
-        with runner.isolated_filesystem():
-            result = runner.invoke(main, ["init", "--board", "esp32"])
-            assert result.exit_code == 0
-            content = Path("CLAUDE.md").read_text()
-            assert "/dev/cu.usbserial-0001" in content
+        monkeypatch.chdir(tmp_path)
+        result = runner.invoke(main, ["init", "--board", "esp32"], standalone_mode=False, catch_exceptions=False)
+        assert result.exit_code == 0
+        content = Path("CLAUDE.md").read_text()
+        assert "/dev/cu.usbserial-0001" in content
 
 
 class TestBoards:
@@ -137,10 +155,9 @@ class TestBoards:
         result = runner.invoke(main, ["boards"])
         assert "esp32:esp32:esp32" in result.output
 
-    def test_boards_shows_all_board_count(self, runner):
-        from edesto_dev.boards import list_boards
+    def test_boards_shows_all_board_count(self, runner, all_boards):
         result = runner.invoke(main, ["boards"])
-        for board in list_boards():
+        for board in all_boards:
             assert board.slug in result.output, f"Missing {board.slug} in output"
 
 
@@ -153,6 +170,40 @@ class TestDoctor:
         result = runner.invoke(main, ["doctor"])
         assert "arduino-cli" in result.output
 
+    @patch("edesto_dev.cli.os.scandir")
+    def test_doctor_lists_usb_serial_ports(self, mock_scandir, runner):
+        entries = []
+        for name in ["ttyS0", "ttyUSB0", "cu.usbserial-0001", "ttyACM0"]:
+            entry = MagicMock()
+            entry.name = name
+            entries.append(entry)
+        mock_scandir.return_value.__enter__.return_value = entries
+        result = runner.invoke(main, ["doctor"])
+        assert "[OK] Serial ports found" in result.output
+        assert "/dev/ttyUSB0" in result.output
+        assert "/dev/ttyACM0" in result.output
+        assert "/dev/cu.usbserial-0001" in result.output
+        assert "/dev/ttyS0" not in result.output
+
+    @patch("subprocess.run")
+    @patch("shutil.which", return_value="/usr/bin/arduino-cli")
+    def test_doctor_shows_first_version_line(self, mock_which, mock_run, runner):
+        mock_run.return_value = MagicMock(stdout="arduino-cli  Version: 1.1.1\nA new release is available\n")
+        result = runner.invoke(main, ["doctor"])
+        assert result.exit_code == 0
+        assert "     arduino-cli  Version: 1.1.1\n" in result.output
+        assert "A new release is available" not in result.output
+
+    @patch("subprocess.run", side_effect=subprocess.TimeoutExpired("arduino-cli", 5))
+    @patch("shutil.which", return_value="/usr/bin/arduino-cli")
+    def test_doctor_times_out_hung_arduino_cli(self, mock_which, mock_run, runner):
+        result = runner.invoke(main, ["doctor"])
+        assert result.exit_code == 0
+        assert mock_run.call_args.kwargs["timeout"] == 5
+        lines = result.output.splitlines()
+        found = lines.index("[OK] arduino-cli found: /usr/bin/arduino-cli")
+        assert not lines[found + 1].startswith("     ")
+
     @patch("shutil.which", return_value=None)
     def test_doctor_warns_missing_arduino_cli(self, mock_which, runner):
         result = runner.invoke(main, ["doctor"])
@@ -160,27 +211,27 @@ class TestDoctor:
 
 
 class TestIntegration:
-    def test_full_workflow(self, runner):
+    def test_full_workflow(self, runner, tmp_path, monkeypatch):
         """Test the full init -> read -> verify workflow."""
-        with runner.isolated_filesystem():
-            # Generate CLAUDE.md
-            result = runner.invoke(main, ["init", "--board", "esp32", "--port", "/dev/cu.usbserial-0001"])
-            assert result.exit_code == 0
-
-            # Verify CLAUDE.md content
-            content = Path("CLAUDE.md").read_text()
-            assert "# Embedded Development: ESP32" in content
-            assert "esp32:esp32:esp32" in content
-            assert "/dev/cu.usbserial-0001" in content
-            assert "arduino-cli compile" in content
-            assert "arduino-cli upload" in content
-            assert "Development Loop" in content
-            assert "serial.Serial" in content
-            assert "[READY]" in content
-            assert "ADC2" in content  # ESP32-specific pitfall
-
-            # Verify .cursorrules matches
-            assert Path(".cursorrules").read_text() == content
+        monkeypatch.chdir(tmp_path)
+        # Generate CLAUDE.md
+        result = runner.invoke(main, ["init", "--board", "esp32", "--port", "/dev/cu.usbserial-0001"], standalone_mode=False, catch_exceptions=False)
+        assert result.exit_code == 0
+
+        # Verify CLAUDE.md content
+        content = Path("CLAUDE.md").read_text()
+        assert "# Embedded Development: ESP32" in content
+        assert "esp32:esp32:esp32" in content
+        assert "/dev/cu.usbserial-0001" in content
+        assert "arduino-cli compile" in content
+        assert "arduino-cli upload" in content
+        assert "Development Loop" in content
+        assert "serial.Serial" in content
+        assert "[READY]" in content
+        assert "ADC2" in content  # ESP32-specific pitfall
+
+        # Verify .cursorrules matches
+        assert Path(".cursorrules").read_text() == content
 
     def test_help_output(self, runner):
         result = runner.invoke(main, ["--help"])
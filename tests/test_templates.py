@@ -55,6 +55,16 @@ class TestRenderTemplate:
         assert "serial.Serial" in result
         assert "[READY]" in result
         assert "115200" in result
+        assert "time.monotonic()" in result
+        assert "time.time()" not in result
+
+    @pytest.mark.parametrize("slug", ["esp32", "arduino-uno"])
+    def test_serial_timeout_fits_readline(self, slug):
+        """readline() returns a partial line when the timeout expires, so it needs a long timeout."""
+        result = render_template(get_board(slug), port="/dev/ttyUSB0")
+        assert "ser.readline()" in result
+        timeout = float(re.search(r"serial\.Serial\([^)]*timeout=([\d.]+)\)", result).group(1))
+        assert timeout >= 1
 
     def test_has_serial_conventions(self):
         board = get_board("esp32")
@@ -98,6 +108,12 @@ class TestRenderTemplate:
         assert "datasheets/" in result
         assert ".pdf" in result.lower()
 
+    def test_repeat_render_is_cached(self):
+        board = get_board("esp32")
+        first = render_template(board, port="/dev/ttyUSB0")
+        assert render_template(board, port="/dev/ttyUSB0") is first
+        assert render_template(board, port="/dev/ttyUSB1") is not first
+
 
 class TestAllBoardsRender:
     @pytest.mark.parametrize("slug", [b.slug for b in list_boards()])